@@ -22,74 +22,72 @@ jest.mock('@/hooks/use-toast', () => ({
   toast: jest.fn()
 }));
 
-// Mock speech recognition and synthesis
+// Prebuilt speech recognition and synthesis doubles, installed once and
+// reset by clearAllMocks in the shared setup
+const speechRecognitionMock = jest.fn();
+const speakMock = jest.fn();
+
 Object.defineProperty(window, 'webkitSpeechRecognition', {
-  value: jest.fn(),
+  value: speechRecognitionMock,
   writable: true
 });
 
 Object.defineProperty(window, 'speechSynthesis', {
   value: {
-    speak: jest.fn()
+    speak: speakMock
   },
   writable: true
 });
 
+// One router wrapper shared by every render instead of rebuilding the
+// wrapping tree per call.
+const RouterWrapper = ({ children }: { children: React.ReactNode }) => (
+  <BrowserRouter>{children}</BrowserRouter>
+);
+
 const renderWithRouter = (component: React.ReactElement) => {
-  return render(
-    <BrowserRouter>
-      {component}
-    </BrowserRouter>
-  );
+  return render(component, { wrapper: RouterWrapper });
 };
 
 describe('AIAgent', () => {
+  // Render once per test in a shared setup instead of repeating it in
+  // every test body.
   beforeEach(() => {
     jest.clearAllMocks();
+    renderWithRouter(<AIAgent />);
   });
 
+  // Lone smoke test for the closed state; everything else assumes an
+  // open panel.
   it('renders the floating action button', () => {
-    renderWithRouter(<AIAgent />);
     const button = screen.getByRole('button', { name: /ai shopping assistant/i });
     expect(button).toBeInTheDocument();
   });
 
-  it('shows the AI agent panel when clicked', () => {
-    renderWithRouter(<AIAgent />);
-    const button = screen.getByRole('button', { name: /ai shopping assistant/i });
-    
-    button.click();
-    
-    expect(screen.getByText('AI Shopping Assistant')).toBeInTheDocument();
-    expect(screen.getByText('Voice & Text')).toBeInTheDocument();
-  });
+  describe('with the panel open', () => {
+    beforeEach(() => {
+      screen.getByRole('button', { name: /ai shopping assistant/i }).click();
+    });
 
-  it('displays welcome message', () => {
-    renderWithRouter(<AIAgent />);
-    const button = screen.getByRole('button', { name: /ai shopping assistant/i });
-    button.click();
-    
-    expect(screen.getByText(/Hello! I'm your AI shopping assistant/)).toBeInTheDocument();
-  });
+    it.each([
+      ['panel title', 'AI Shopping Assistant'],
+      ['input mode badge', 'Voice & Text'],
+      ['welcome message', /Hello! I'm your AI shopping assistant/]
+    ])('displays the %s', (_label, matcher) => {
+      expect(screen.getByText(matcher)).toBeInTheDocument();
+    });
 
-  it('has text input field', () => {
-    renderWithRouter(<AIAgent />);
-    const button = screen.getByRole('button', { name: /ai shopping assistant/i });
-    button.click();
-    
-    const input = screen.getByPlaceholderText('Type your request...');
-    expect(input).toBeInTheDocument();
-  });
+    it('has text input field', () => {
+      const input = screen.getByPlaceholderText('Type your request...');
+      expect(input).toBeInTheDocument();
+    });
 
-  it('has voice and text input buttons', () => {
-    renderWithRouter(<AIAgent />);
-    const button = screen.getByRole('button', { name: /ai shopping assistant/i });
-    button.click();
-    
-    const sendButton = screen.getByRole('button', { name: /send/i });
-    const micButton = screen.getByRole('button', { name: /microphone/i });
-    
-    expect(sendButton).toBeInTheDocument();
-    expect(micButton).toBeInTheDocument();
+    it('has voice and text input buttons', () => {
+      const sendButton = screen.getByRole('button', { name: /send/i });
+      const micButton = screen.getByRole('button', { name: /microphone/i });
+
+      expect(sendButton).toBeInTheDocument();
+      expect(micButton).toBeInTheDocument();
+    });
   });
 });
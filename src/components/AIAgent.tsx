@@ -5,7 +5,7 @@ import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
-import { Mic, MicOff, Send, X, Bot, User, Volume2, Lightbulb } from 'lucide-react';
+import { Mic, MicOff, Send, X, Bot, User, Lightbulb } from 'lucide-react';
 import { toast } from '@/hooks/use-toast';
 import { CommandParser, type Command, type ParsedCommand } from '@/lib/commandParser';
 
@@ -17,18 +17,26 @@ interface Message {
   suggestions?: string[];
 }
 
+const WELCOME_MESSAGE =
+  'Hello! I\'m your AI shopping assistant. I can help you navigate the store, search for products, manage your cart, and more. Try saying "go to products" or "search for shoes".';
+
+// Monotonic id source; wall-clock ids collide when two messages land in
+// the same millisecond, producing duplicate React keys
+let messageIdCounter = 0;
+const nextMessageId = () => String(++messageIdCounter);
+
 export function AIAgent() {
   const navigate = useNavigate();
   const location = useLocation();
-  const { state, dispatch } = useStore();
+  const { dispatch } = useStore();
   const [isListening, setIsListening] = useState(false);
   const [isOpen, setIsOpen] = useState(false);
   const [inputText, setInputText] = useState('');
-  const [messages, setMessages] = useState<Message[]>([
+  const [messages, setMessages] = useState<Message[]>(() => [
     {
-      id: '1',
+      id: nextMessageId(),
       type: 'assistant',
-      content: 'Hello! I\'m your AI shopping assistant. I can help you navigate the store, search for products, manage your cart, and more. Try saying "go to products" or "search for shoes".',
+      content: WELCOME_MESSAGE,
       timestamp: new Date()
     }
   ]);
@@ -88,7 +96,7 @@ export function AIAgent() {
 
   const addMessage = useCallback((type: 'user' | 'assistant', content: string, suggestions?: string[]) => {
     const newMessage: Message = {
-      id: Date.now().toString(),
+      id: nextMessageId(),
       type,
       content,
       timestamp: new Date(),
@@ -97,6 +105,17 @@ export function AIAgent() {
     setMessages(prev => [...prev, newMessage]);
   }, []);
 
+  // Append several messages in one state update instead of one update per
+  // message.
+  const addMessages = useCallback((entries: Array<Pick<Message, 'type' | 'content' | 'suggestions'>>) => {
+    const newMessages: Message[] = entries.map(entry => ({
+      id: nextMessageId(),
+      timestamp: new Date(),
+      ...entry
+    }));
+    setMessages(prev => [...prev, ...newMessages]);
+  }, []);
+
   const executeCommand = useCallback(async (command: Command) => {
     setIsProcessing(true);
     
@@ -176,31 +195,41 @@ export function AIAgent() {
     }
   }, [navigate, dispatch, addMessage, speak]);
 
-  const handleCommand = useCallback((input: string) => {
+  const handleCommand = useCallback((input: string, echoInput = true) => {
     const parsedCommand: ParsedCommand = CommandParser.parse(input);
-    
+
     if (parsedCommand.command) {
+      if (echoInput) {
+        addMessage('user', input);
+      }
       executeCommand(parsedCommand.command);
     } else {
       const suggestions = parsedCommand.suggestions || [];
-      addMessage('assistant', `I didn't understand "${input}". Here are some suggestions:`, suggestions);
+      const reply = {
+        type: 'assistant' as const,
+        content: `I didn't understand "${input}". Here are some suggestions:`,
+        suggestions
+      };
+      if (echoInput) {
+        addMessages([{ type: 'user', content: input }, reply]);
+      } else {
+        addMessages([reply]);
+      }
       speak(`I didn't understand that. Try saying help to see what I can do.`);
     }
-  }, [executeCommand, addMessage, speak]);
+  }, [executeCommand, addMessage, addMessages, speak]);
 
   const handleVoiceCommand = useCallback((transcript: string) => {
-    addMessage('user', transcript);
     handleCommand(transcript);
-  }, [addMessage, handleCommand]);
+  }, [handleCommand]);
 
   const handleTextSubmit = useCallback((e: React.FormEvent) => {
     e.preventDefault();
     if (!inputText.trim()) return;
 
-    addMessage('user', inputText);
     handleCommand(inputText);
     setInputText('');
-  }, [inputText, addMessage, handleCommand]);
+  }, [inputText, handleCommand]);
 
   const toggleListening = useCallback(() => {
     if (!recognitionRef.current) {
@@ -230,7 +259,7 @@ export function AIAgent() {
 
   const handleSuggestionClick = useCallback((suggestion: string) => {
     setInputText(suggestion);
-    handleCommand(suggestion);
+    handleCommand(suggestion, false);
   }, [handleCommand]);
 
   return (
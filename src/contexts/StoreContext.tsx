@@ -1,4 +1,4 @@
-import React, { createContext, useContext, useReducer, useEffect } from 'react';
+import React, { createContext, useContext, useReducer, useEffect, useRef } from 'react';
 
 export interface Product {
   id: string;
@@ -36,7 +36,8 @@ type StoreAction =
   | { type: 'ADD_TO_CART'; payload: Product }
   | { type: 'REMOVE_FROM_CART'; payload: string }
   | { type: 'UPDATE_CART_QUANTITY'; payload: { id: string; quantity: number } }
-  | { type: 'CLEAR_CART' };
+  | { type: 'CLEAR_CART' }
+  | { type: 'LOAD_CART'; payload: CartItem[] };
 
 const initialState: StoreState = {
   products: [],
@@ -90,6 +91,8 @@ function storeReducer(state: StoreState, action: StoreAction): StoreState {
       };
     case 'CLEAR_CART':
       return { ...state, cart: [] };
+    case 'LOAD_CART':
+      return { ...state, cart: action.payload };
     default:
       return state;
   }
@@ -103,22 +106,27 @@ const StoreContext = createContext<{
 export function StoreProvider({ children }: { children: React.ReactNode }) {
   const [state, dispatch] = useReducer(storeReducer, initialState);
 
-  // Load cart from localStorage on mount
+  // Load cart from localStorage on mount in a single dispatch instead of
+  // one ADD_TO_CART per unit of quantity
   useEffect(() => {
     const savedCart = localStorage.getItem('ecommerce-cart');
     if (savedCart) {
-      const cartItems = JSON.parse(savedCart);
-      cartItems.forEach((item: CartItem) => {
-        for (let i = 0; i < item.quantity; i++) {
-          dispatch({ type: 'ADD_TO_CART', payload: item.product });
-        }
-      });
+      const cartItems: CartItem[] = JSON.parse(savedCart);
+      if (cartItems.length > 0) {
+        dispatch({ type: 'LOAD_CART', payload: cartItems });
+      }
     }
   }, []);
 
-  // Save cart to localStorage whenever it changes
+  // Save cart to localStorage whenever it changes, skipping writes when
+  // the serialized content is identical (e.g. the hydration round-trip)
+  const lastSavedCart = useRef<string | null>(null);
   useEffect(() => {
-    localStorage.setItem('ecommerce-cart', JSON.stringify(state.cart));
+    const serialized = JSON.stringify(state.cart);
+    if (serialized !== lastSavedCart.current) {
+      lastSavedCart.current = serialized;
+      localStorage.setItem('ecommerce-cart', serialized);
+    }
   }, [state.cart]);
 
   return (
@@ -288,6 +288,13 @@ export const mockProducts: Product[] = [
   },
 ];
 
+// Lowercased search fields aligned with mockProducts by index, computed
+// once so search does not re-lowercase every product on every keystroke
+export const productSearchIndex = mockProducts.map(product => ({
+  nameLower: product.name.toLowerCase(),
+  categoryLower: product.category.toLowerCase(),
+}));
+
 export const categories = [
   'All',
   'Electronics',
@@ -0,0 +1,52 @@
+import { CommandParser } from './commandParser';
+
+// Exercise the parser directly instead of driving it through the AIAgent
+// component; the UI-level behavior is covered in AIAgent.test.tsx.
+describe('CommandParser', () => {
+  it('matches exact commands', () => {
+    const { command } = CommandParser.parse('view cart');
+    expect(command).toEqual({ type: 'cart', action: 'view', confidence: 1.0 });
+  });
+
+  it.each([
+    ['go to products', { type: 'navigation', action: 'navigate', parameters: { path: '/products' } }],
+    ['search for shoes', { type: 'search', action: 'search', parameters: { query: 'shoes' } }],
+    ['filter by electronics', { type: 'category', action: 'filter', parameters: { category: 'electronics' } }],
+    ['add to cart wireless mouse', { type: 'cart', action: 'add', parameters: { product: 'wireless mouse' } }],
+    ['what can you do', { type: 'help', action: 'help' }]
+  ])('parses "%s"', (input, expected) => {
+    expect(CommandParser.parse(input).command).toMatchObject(expected);
+  });
+
+  // The shopping workflows (browse, search, view cart, checkout) share one
+  // parametrized table instead of a copy-pasted test per phrasing
+  it.each([
+    ['take me to cart', { type: 'navigation', parameters: { path: '/cart' } }],
+    ['navigate to checkout', { type: 'navigation', parameters: { path: '/checkout' } }],
+    ['find red dresses', { type: 'search', parameters: { query: 'red dresses' } }],
+    ['show cart', { type: 'cart', action: 'view' }],
+    ['clear cart', { type: 'cart', action: 'clear' }]
+  ])('handles the workflow phrasing "%s"', (input, expected) => {
+    expect(CommandParser.parse(input).command).toMatchObject(expected);
+  });
+
+  it('serves repeated commands from the parse cache', () => {
+    const first = CommandParser.parse('search for shoes');
+    const second = CommandParser.parse('Search   for shoes');
+
+    // Same normalized input hits the memoized entry: identical command
+    // object, caller-specific original text
+    expect(second.command).toBe(first.command);
+    expect(second.originalText).toBe('Search   for shoes');
+  });
+
+  it.each([
+    ['xyzzy plugh'],
+    ['zz'],
+    ['purple monkey dishwasher']
+  ])('returns suggestions for unrecognized input "%s"', (input) => {
+    const result = CommandParser.parse(input);
+    expect(result.command).toBeNull();
+    expect(result.suggestions?.length).toBeGreaterThan(0);
+  });
+});
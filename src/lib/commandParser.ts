@@ -48,78 +48,124 @@ export class CommandParser {
     'order': '/checkout'
   };
 
+  // Entries view of the locations table, materialized once instead of per
+  // parseNavigation call
+  private static locationEntries = Object.entries(CommandParser.locations);
+
   private static categories = [
     'electronics', 'clothing', 'books', 'home', 'sports', 'beauty', 'toys', 'automotive'
   ];
 
+  // Compiled once; a single pass drops pasted markup and collapses runs
+  // of whitespace (tabs, newlines, double spaces from voice transcripts)
+  // into single spaces
+  private static noiseRegex = /(?:<[^>]*>|\s)+/g;
+
+  // Lighter pattern for the common case of markup-free input
+  private static whitespaceRegex = /\s+/g;
+
+  // Memoized parse results keyed by normalized input; repeated commands
+  // (suggestion clicks, retried voice transcripts) skip the keyword scans
+  private static parseCache = new Map<string, Omit<ParsedCommand, 'originalText'>>();
+  private static maxCacheSize = 100;
+
+  // Longest reasonable command; anything beyond this is truncated before
+  // the regex and keyword scans run
+  private static maxInputLength = 500;
+
   static parse(input: string): ParsedCommand {
-    const lowerInput = input.toLowerCase().trim();
+    const boundedInput =
+      input.length > this.maxInputLength ? input.slice(0, this.maxInputLength) : input;
+    // Typed and spoken commands almost never contain markup; a single
+    // indexOf scan decides whether the heavier alternation is needed
+    const lowerInput = (boundedInput.indexOf('<') === -1
+      ? boundedInput.replace(this.whitespaceRegex, ' ')
+      : boundedInput.replace(this.noiseRegex, ' '))
+      .toLowerCase()
+      .trim();
+
+    let result = this.parseCache.get(lowerInput);
+    if (result) {
+      // Re-insert on hit so Map iteration order tracks recency and
+      // eviction below drops the least recently used entry
+      this.parseCache.delete(lowerInput);
+    } else {
+      result = this.parseNormalized(lowerInput);
+      if (this.parseCache.size >= this.maxCacheSize) {
+        this.parseCache.delete(this.parseCache.keys().next().value as string);
+      }
+    }
+    this.parseCache.set(lowerInput, result);
+
+    return { ...result, originalText: input };
+  }
+
+  private static parseNormalized(lowerInput: string): Omit<ParsedCommand, 'originalText'> {
     const words = lowerInput.split(' ');
-    
+
     // Check for exact matches first
     const exactMatch = this.findExactMatch(lowerInput);
     if (exactMatch) {
-      return { command: exactMatch, originalText: input };
+      return { command: exactMatch };
     }
 
     // Check for navigation commands
     const navigationCommand = this.parseNavigation(lowerInput, words);
     if (navigationCommand) {
-      return { command: navigationCommand, originalText: input };
+      return { command: navigationCommand };
     }
 
     // Check for search commands
     const searchCommand = this.parseSearch(lowerInput, words);
     if (searchCommand) {
-      return { command: searchCommand, originalText: input };
+      return { command: searchCommand };
     }
 
     // Check for category commands
     const categoryCommand = this.parseCategory(lowerInput, words);
     if (categoryCommand) {
-      return { command: categoryCommand, originalText: input };
+      return { command: categoryCommand };
     }
 
     // Check for cart commands
     const cartCommand = this.parseCart(lowerInput, words);
     if (cartCommand) {
-      return { command: cartCommand, originalText: input };
+      return { command: cartCommand };
     }
 
     // Check for help commands
     const helpCommand = this.parseHelp(lowerInput, words);
     if (helpCommand) {
-      return { command: helpCommand, originalText: input };
+      return { command: helpCommand };
     }
 
     // Check for product-specific commands
     const productCommand = this.parseProduct(lowerInput, words);
     if (productCommand) {
-      return { command: productCommand, originalText: input };
+      return { command: productCommand };
     }
 
     // Generate suggestions for unrecognized commands
     const suggestions = this.generateSuggestions(lowerInput);
-    
+
     return {
       command: null,
-      originalText: input,
       suggestions
     };
   }
 
-  private static findExactMatch(input: string): Command | null {
-    const exactMatches: Record<string, Command> = {
-      'help': { type: 'help', action: 'help', confidence: 1.0 },
-      'what can you do': { type: 'help', action: 'help', confidence: 1.0 },
-      'go home': { type: 'navigation', action: 'navigate', parameters: { path: '/' }, confidence: 1.0 },
-      'show cart': { type: 'cart', action: 'view', confidence: 1.0 },
-      'view cart': { type: 'cart', action: 'view', confidence: 1.0 },
-      'clear cart': { type: 'cart', action: 'clear', confidence: 1.0 },
-      'empty cart': { type: 'cart', action: 'clear', confidence: 1.0 }
-    };
+  private static exactMatches: Record<string, Command> = {
+    'help': { type: 'help', action: 'help', confidence: 1.0 },
+    'what can you do': { type: 'help', action: 'help', confidence: 1.0 },
+    'go home': { type: 'navigation', action: 'navigate', parameters: { path: '/' }, confidence: 1.0 },
+    'show cart': { type: 'cart', action: 'view', confidence: 1.0 },
+    'view cart': { type: 'cart', action: 'view', confidence: 1.0 },
+    'clear cart': { type: 'cart', action: 'clear', confidence: 1.0 },
+    'empty cart': { type: 'cart', action: 'clear', confidence: 1.0 }
+  };
 
-    return exactMatches[input] || null;
+  private static findExactMatch(input: string): Command | null {
+    return this.exactMatches[input] || null;
   }
 
   private static parseNavigation(input: string, words: string[]): Command | null {
@@ -127,7 +173,7 @@ export class CommandParser {
       if (input.includes(keyword)) {
         const remainingText = input.replace(keyword, '').trim();
         
-        for (const [location, path] of Object.entries(this.locations)) {
+        for (const [location, path] of this.locationEntries) {
           if (remainingText.includes(location)) {
             return {
               type: 'navigation',
@@ -207,15 +253,15 @@ export class CommandParser {
     return null;
   }
 
+  // Product-related patterns, compiled once at module load
+  private static productPatterns = [
+    /(?:show|display|view|see)\s+(.+)/i,
+    /(?:tell me about|what is|describe)\s+(.+)/i,
+    /(?:price of|cost of)\s+(.+)/i
+  ];
+
   private static parseProduct(input: string, words: string[]): Command | null {
-    // Look for product-related patterns
-    const productPatterns = [
-      /(?:show|display|view|see)\s+(.+)/i,
-      /(?:tell me about|what is|describe)\s+(.+)/i,
-      /(?:price of|cost of)\s+(.+)/i
-    ];
-
-    for (const pattern of productPatterns) {
+    for (const pattern of this.productPatterns) {
       const match = input.match(pattern);
       if (match && match[1]) {
         const productName = match[1].trim();
@@ -257,13 +303,16 @@ export class CommandParser {
     return suggestions;
   }
 
-  static getAvailableCommands(): string[] {
-    return [
-      'Navigation: "go to products", "take me to cart", "show me home"',
-      'Search: "search for shoes", "find red dresses", "look for electronics"',
-      'Categories: "show electronics category", "filter by clothing"',
-      'Cart: "add to cart", "view cart", "clear cart"',
-      'Help: "help", "what can you do", "how do I use this"'
-    ];
+  // Built once; callers treat the list as read-only
+  private static availableCommands: readonly string[] = Object.freeze([
+    'Navigation: "go to products", "take me to cart", "show me home"',
+    'Search: "search for shoes", "find red dresses", "look for electronics"',
+    'Categories: "show electronics category", "filter by clothing"',
+    'Cart: "add to cart", "view cart", "clear cart"',
+    'Help: "help", "what can you do", "how do I use this"'
+  ]);
+
+  static getAvailableCommands(): readonly string[] {
+    return this.availableCommands;
   }
 }
@@ -0,0 +1,27 @@
+import { CartItem } from '@/contexts/StoreContext';
+
+export interface OrderSummary {
+  subtotal: number;
+  shipping: number;
+  tax: number;
+  total: number;
+}
+
+export const FREE_SHIPPING_THRESHOLD = 50;
+
+const FLAT_SHIPPING_RATE = 9.99;
+const TAX_RATE = 0.08; // 8% tax
+
+// Totals for a cart, computed in a single pass. Cart and Checkout share
+// this instead of each re-deriving the same figures inline.
+export function calculateOrderSummary(cart: CartItem[]): OrderSummary {
+  let subtotal = 0;
+  for (const item of cart) {
+    subtotal += item.product.price * item.quantity;
+  }
+
+  const shipping = subtotal > FREE_SHIPPING_THRESHOLD ? 0 : FLAT_SHIPPING_RATE;
+  const tax = subtotal * TAX_RATE;
+
+  return { subtotal, shipping, tax, total: subtotal + shipping + tax };
+}
@@ -2,6 +2,7 @@ import React from 'react';
 import { Link } from 'react-router-dom';
 import { Minus, Plus, X, ShoppingBag, ArrowRight } from 'lucide-react';
 import { useStore } from '@/contexts/StoreContext';
+import { calculateOrderSummary, FREE_SHIPPING_THRESHOLD } from '@/lib/orderSummary';
 import { Button } from '@/components/ui/button';
 import { useToast } from '@/hooks/use-toast';
 
@@ -29,14 +30,7 @@ export default function Cart() {
     });
   };
 
-  const subtotal = state.cart.reduce(
-    (sum, item) => sum + item.product.price * item.quantity,
-    0
-  );
-
-  const shipping = subtotal > 50 ? 0 : 9.99;
-  const tax = subtotal * 0.08; // 8% tax
-  const total = subtotal + shipping + tax;
+  const { subtotal, shipping, tax, total } = calculateOrderSummary(state.cart);
 
   if (state.cart.length === 0) {
     return (
@@ -158,10 +152,10 @@ export default function Cart() {
               </div>
             </div>
 
-            {subtotal < 50 && (
+            {subtotal < FREE_SHIPPING_THRESHOLD && (
               <div className="mt-4 p-3 bg-muted/50 rounded-lg">
                 <p className="text-sm text-muted-foreground">
-                  Add ${(50 - subtotal).toFixed(2)} more for free shipping!
+                  Add ${(FREE_SHIPPING_THRESHOLD - subtotal).toFixed(2)} more for free shipping!
                 </p>
               </div>
             )}
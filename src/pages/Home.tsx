@@ -9,16 +9,15 @@ import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 import heroImage from '@/assets/hero-image.jpg';
 
+// Static storefront sections, computed once at module load. Sorting a
+// copy keeps the shared mockProducts array in catalog order.
+const featuredProducts = mockProducts.slice(0, 8);
+const trendingProducts = [...mockProducts]
+  .sort((a, b) => b.rating - a.rating)
+  .slice(0, 4);
+
 export default function Home() {
   const { state } = useStore();
-  
-  // Featured products (first 8)
-  const featuredProducts = mockProducts.slice(0, 8);
-  
-  // Trending products (highest rated)
-  const trendingProducts = mockProducts
-    .sort((a, b) => b.rating - a.rating)
-    .slice(0, 4);
 
   return (
     <div className="min-h-screen">
@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useMemo } from 'react';
 import { useParams, Link, useNavigate } from 'react-router-dom';
 import { ArrowLeft, Star, ShoppingCart, Heart, Share2, Truck, Shield, RotateCcw } from 'lucide-react';
 import { mockProducts } from '@/data/products';
@@ -14,8 +14,20 @@ export default function ProductDetail() {
   const navigate = useNavigate();
   const { toast } = useToast();
   
-  const product = mockProducts.find(p => p.id === id);
-  
+  // Resolve the product and its related items once per id instead of
+  // rescanning the catalog on every render
+  const product = useMemo(() => mockProducts.find(p => p.id === id), [id]);
+
+  const relatedProducts = useMemo(
+    () =>
+      product
+        ? mockProducts
+            .filter(p => p.category === product.category && p.id !== product.id)
+            .slice(0, 4)
+        : [],
+    [product]
+  );
+
   if (!product) {
     return (
       <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
@@ -29,11 +41,6 @@ export default function ProductDetail() {
     );
   }
 
-  // Related products from same category
-  const relatedProducts = mockProducts
-    .filter(p => p.category === product.category && p.id !== product.id)
-    .slice(0, 4);
-
   const handleAddToCart = () => {
     dispatch({ type: 'ADD_TO_CART', payload: product });
     toast({
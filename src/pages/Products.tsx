@@ -1,6 +1,6 @@
 import React, { useState, useMemo } from 'react';
 import { Filter, X } from 'lucide-react';
-import { mockProducts, categories } from '@/data/products';
+import { mockProducts, productSearchIndex, categories } from '@/data/products';
 import { useStore } from '@/contexts/StoreContext';
 import { ProductCard } from '@/components/ProductCard';
 import { Button } from '@/components/ui/button';
@@ -20,32 +20,22 @@ export default function Products() {
     }
   }, []);
 
-  // Filter products based on current filters
+  // Filter products based on current filters in a single pass instead of
+  // one intermediate array per filter
   const filteredProducts = useMemo(() => {
-    let filtered = mockProducts;
-
-    // Search filter
-    if (state.searchQuery) {
-      filtered = filtered.filter(product =>
-        product.name.toLowerCase().includes(state.searchQuery.toLowerCase()) ||
-        product.category.toLowerCase().includes(state.searchQuery.toLowerCase())
-      );
-    }
-
-    // Category filter
-    if (state.selectedCategory && state.selectedCategory !== 'All') {
-      filtered = filtered.filter(product => product.category === state.selectedCategory);
-    }
-
-    // Price range filter
-    filtered = filtered.filter(product => 
-      product.price >= state.priceRange[0] && product.price <= state.priceRange[1]
+    const query = state.searchQuery.toLowerCase();
+    const categoryFilter =
+      state.selectedCategory && state.selectedCategory !== 'All' ? state.selectedCategory : null;
+    const [minPrice, maxPrice] = state.priceRange;
+
+    return mockProducts.filter((product, index) =>
+      (!query ||
+        productSearchIndex[index].nameLower.includes(query) ||
+        productSearchIndex[index].categoryLower.includes(query)) &&
+      (!categoryFilter || product.category === categoryFilter) &&
+      product.price >= minPrice && product.price <= maxPrice &&
+      product.rating >= state.minRating
     );
-
-    // Rating filter
-    filtered = filtered.filter(product => product.rating >= state.minRating);
-
-    return filtered;
   }, [state.searchQuery, state.selectedCategory, state.priceRange, state.minRating]);
 
   const handleCategoryChange = (category: string) => {